@@ -11,39 +11,98 @@ as more editing tools or better timeline management can be added easily.
 """
 from __future__ import annotations
 
+import functools
 import math
+import sys
 from bisect import bisect_right
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, ClassVar, Dict, List, Tuple
 
+import numpy as np
 import pygame
 from tkinter import Tk, filedialog, simpledialog
 
 from level import Level
 
+try:  # numba is optional; the NumPy path below is used when it is missing.
+    from numba import njit
+except ImportError:  # pragma: no cover - exercised only without numba
+    njit = None
+
 from easing import (
+    EASING_ARRAY_FUNCTIONS,
     EASING_FUNCTIONS,
     BackParams,
     BounceParams,
     ElasticParams,
     cubic_bezier,
-    elastic,
+    elastic_array,
     ease_in_back,
-    ease_in_bounce,
-    ease_in_out_back,
-    ease_in_out_bounce,
+    ease_in_bounce_array,
+    ease_in_out_back_array,
+    ease_in_out_bounce_array,
     ease_out_back,
-    ease_out_bounce,
+    ease_out_bounce_array,
     linear,
 )
 
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _cumulate_positions(heading, step_cos, step_sin):
+        """Fused gather + prefix scan over the per-tile step deltas."""
+        n = heading.shape[0]
+        xs = np.empty(n + 1, dtype=np.float64)
+        ys = np.empty(n + 1, dtype=np.float64)
+        xs[0] = 0.0
+        ys[0] = 0.0
+        for i in range(n):
+            h = heading[i]
+            xs[i + 1] = xs[i] + step_cos[h]
+            ys[i + 1] = ys[i] + step_sin[h]
+        return xs, ys
+else:
+    _cumulate_positions = None
+
+# Interned once so the hot comparisons in load/save hit CPython's pointer
+# fast path whenever the parser hands back an interned string.
+_MOVE_CAMERA = sys.intern("MoveCamera")
+
+# Template for exported MoveCamera actions: copying a prebuilt dict skips
+# re-hashing nine key strings per keyframe when saving large tracks.
+_BASE_ACT = {
+    "floor": 0,
+    "eventType": _MOVE_CAMERA,
+    "duration": 0,
+    "relativeTo": "World",
+    "position": None,
+    "zoom": 0.0,
+    "angleOffset": 0.0,
+    "ease": "Linear",
+    "customEase": None,
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _render_text(font: pygame.font.Font, text: str, colour: tuple) -> pygame.Surface:
+    """Render (and cache) a text surface.
+
+    Labels are mostly static or change at discrete steps (slider values), so
+    caching by (font, text, colour) removes a ``font.render`` per label per
+    frame - one of the more expensive pygame calls in the draw loop.
+    """
+    return font.render(text, True, colour).convert_alpha()
+
+
 # ---------------------------------------------------------------------------
 # Data models
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+# ``slots=True`` drops the per-instance ``__dict__``: keyframes are created in
+# bulk on level load and read in the interpolation hot path, so the fixed slot
+# layout saves ~100 bytes each and speeds up attribute access.
+@dataclass(slots=True)
 class Keyframe:
     time: int
     x: float
@@ -62,6 +121,19 @@ class Keyframe:
     # interpolation.  This makes it possible to layer multiple offset sources
     # such as screen shake or scripted camera movements.
     offsets: List[Tuple[float, float]] = field(default_factory=list)
+    # Pre-sampled easing curve used by the per-frame interpolation hot path.
+    # Rebuilt lazily and invalidated whenever the ease or its parameters
+    # change, so the string/branch dispatch below runs once per edit instead
+    # of once per frame.
+    _ease_lut: np.ndarray | None = field(default=None, repr=False, compare=False)
+    # Last rendered export curve as (parameter key, samples); the key embeds
+    # every input so the cache validates itself without explicit dirtying.
+    _curve_cache: tuple | None = field(default=None, repr=False, compare=False)
+
+    LUT_SAMPLES = 256
+    # Shared, read-only sample grids keyed by sample count; only two sizes
+    # ever occur (the 60-sample export curve and the 256-sample table).
+    _T_GRIDS: ClassVar[Dict[int, np.ndarray]] = {}
 
     def total_offset(self) -> Tuple[float, float]:
         """Return the cumulative offset from all layers."""
@@ -69,6 +141,65 @@ class Keyframe:
         oy = sum(o[1] for o in self.offsets)
         return ox, oy
 
+    def invalidate_ease(self) -> None:
+        """Drop the cached easing table after an ease/parameter edit."""
+        self._ease_lut = None
+
+    def render_curve(self, samples: int = 60) -> List[float]:
+        """Sample the easing curve for this keyframe as ``samples`` floats."""
+        ease = self.ease
+        t = self._T_GRIDS.get(samples)
+        if t is None:
+            t = np.linspace(0.0, 1.0, samples)
+            t.flags.writeable = False
+            self._T_GRIDS[samples] = t
+        # Evaluate over the whole sample grid with a few ufunc calls instead
+        # of one Python dispatch per sample.  A single hashed lookup picks the
+        # parameterised handler; the substring tests this replaces were both
+        # slower and ambiguous ("EaseInBack" also contains "Back").
+        handler = _EASE_CURVE_DISPATCH.get(ease)
+        if handler is not None:
+            return handler(self, t)
+        arr_func = EASING_ARRAY_FUNCTIONS.get(ease)
+        if arr_func is not None:
+            return np.asarray(arr_func(t)).tolist()
+        return [EASING_FUNCTIONS.get(ease, linear)(x) for x in t.tolist()]
+
+    def ease_lut(self) -> np.ndarray:
+        """Return the cached easing table, rebuilding it if invalidated."""
+        lut = self._ease_lut
+        if lut is None:
+            if self.custom_ease:
+                lut = np.asarray(self.custom_ease, dtype=np.float32)
+            else:
+                lut = np.asarray(
+                    self.render_curve(self.LUT_SAMPLES), dtype=np.float32
+                )
+            self._ease_lut = lut
+        return lut
+
+
+def _render_bezier_curve(kf: Keyframe, t: np.ndarray) -> List[float]:
+    # Bezier keeps a scalar loop: its Newton inversion is inherently
+    # per-sample.
+    func = cubic_bezier(
+        kf.bezier_p1[0], kf.bezier_p1[1], kf.bezier_p2[0], kf.bezier_p2[1]
+    )
+    return [func(x) for x in t.tolist()]
+
+
+# Handlers for eases that take per-keyframe parameters, keyed by exact name.
+_EASE_CURVE_DISPATCH: Dict[str, Callable[[Keyframe, np.ndarray], List[float]]] = {
+    "Elastic": lambda kf, t: elastic_array(t, kf.elastic_params).tolist(),
+    "EaseInBack": lambda kf, t: ease_in_back(t, kf.back_params).tolist(),
+    "EaseOutBack": lambda kf, t: ease_out_back(t, kf.back_params).tolist(),
+    "EaseInOutBack": lambda kf, t: ease_in_out_back_array(t, kf.back_params).tolist(),
+    "EaseInBounce": lambda kf, t: ease_in_bounce_array(t, kf.bounce_params).tolist(),
+    "EaseOutBounce": lambda kf, t: ease_out_bounce_array(t, kf.bounce_params).tolist(),
+    "EaseInOutBounce": lambda kf, t: ease_in_out_bounce_array(t, kf.bounce_params).tolist(),
+    "Bezier": _render_bezier_curve,
+}
+
 
 class CameraTrack:
     """Maintains a list of keyframes and interpolates between them."""
@@ -76,16 +207,71 @@ class CameraTrack:
     def __init__(self) -> None:
         self.keyframes: List[Keyframe] = []
         self.selected_index: int | None = None
+        # Parallel sorted list of keyframe times so the per-frame bracket
+        # lookup is a bisect instead of a linear scan.
+        self._times: List[int] = []
+        # SoA mirror of the interpolated state: one (N, 4) float32 row of
+        # (x, y, zoom, angle) per keyframe, so the blend is a single vector
+        # op over contiguous memory instead of four object-attribute reads.
+        self._xyza: np.ndarray = np.empty((0, 4), dtype=np.float32)
+        # Playback cursor: during playback ``get_state_at`` is queried with
+        # monotonically increasing times, so the bracket from the previous
+        # query is almost always still valid.  (cursor index, query time).
+        self._cursor: Tuple[int, int] = (0, -1)
+        # Bumped on every mutation so cached samplings (timeline curves) can
+        # tell whether the track changed underneath them.
+        self._rev = 0
+
+    def _rebuild_times(self) -> None:
+        self._times = [k.time for k in self.keyframes]
+        self._xyza = np.array(
+            [(k.x, k.y, k.zoom, k.angle) for k in self.keyframes],
+            dtype=np.float32,
+        ).reshape(-1, 4)
+        self._cursor = (0, -1)
+        self._rev += 1
+
+    def sync_selected(self) -> None:
+        """Refresh the SoA row after the selected keyframe was edited."""
+        i = self.selected_index
+        if i is None:
+            return
+        kf = self.keyframes[i]
+        self._xyza[i] = (kf.x, kf.y, kf.zoom, kf.angle)
+        self._rev += 1
+
+    def set_keyframes(self, keyframes: List[Keyframe]) -> None:
+        """Replace the keyframe list wholesale (used on level load)."""
+        self.keyframes = keyframes
+        self._rebuild_times()
+
+    def _insert_keyframe(self, kf: Keyframe) -> None:
+        """Insert ``kf`` at its sorted position and select it.
+
+        The bisected insertion point doubles as the new selected index, so no
+        re-sort or identity scan is needed.
+        """
+        # Keyframes added while scrubbing forward usually land past the end;
+        # appending there skips the bisect and the O(N) list shifts.
+        if not self._times or kf.time >= self._times[-1]:
+            idx = len(self._times)
+        else:
+            idx = bisect_right(self._times, kf.time)
+        self._times.insert(idx, kf.time)
+        self.keyframes.insert(idx, kf)
+        self._xyza = np.insert(
+            self._xyza, idx, (kf.x, kf.y, kf.zoom, kf.angle), axis=0
+        )
+        self.selected_index = idx
+        self._cursor = (0, -1)
+        self._rev += 1
 
     def add_keyframe(
         self, time: int, x: float, y: float, zoom: float, angle: float,
         ease: str = "Linear"
     ) -> None:
         """Add a keyframe and select it."""
-        kf = Keyframe(time, x, y, zoom, angle, ease)
-        self.keyframes.append(kf)
-        self.keyframes.sort(key=lambda k: k.time)
-        self.selected_index = self.keyframes.index(kf)
+        self._insert_keyframe(Keyframe(time, x, y, zoom, angle, ease))
 
     def get_state_at(self, time_ms: int) -> Tuple[float, float, float, float]:
         """Linear interpolation between keyframes with easing applied."""
@@ -97,53 +283,104 @@ class CameraTrack:
         if time_ms >= self.keyframes[-1].time:
             kf = self.keyframes[-1]
             return kf.x, kf.y, kf.zoom, kf.angle
-        for i in range(1, len(self.keyframes)):
-            a = self.keyframes[i - 1]
-            b = self.keyframes[i]
-            if a.time <= time_ms <= b.time:
-                alpha = (time_ms - a.time) / (b.time - a.time)
-                # apply easing
-                if b.custom_ease:
-                    idx = min(int(alpha * (len(b.custom_ease) - 1)), len(b.custom_ease) - 1)
-                    alpha = b.custom_ease[idx]
-                else:
-                    if b.ease == "Elastic":
-                        alpha = elastic(alpha, b.elastic_params)
-                    elif "Back" in b.ease:
-                        if b.ease == "EaseInBack":
-                            alpha = ease_in_back(alpha, b.back_params)
-                        elif b.ease == "EaseOutBack":
-                            alpha = ease_out_back(alpha, b.back_params)
-                        else:
-                            alpha = ease_in_out_back(alpha, b.back_params)
-                    elif "Bounce" in b.ease:
-                        if b.ease == "EaseInBounce":
-                            alpha = ease_in_bounce(alpha, b.bounce_params)
-                        elif b.ease == "EaseOutBounce":
-                            alpha = ease_out_bounce(alpha, b.bounce_params)
-                        else:
-                            alpha = ease_in_out_bounce(alpha, b.bounce_params)
-                    else:
-                        func = EASING_FUNCTIONS.get(b.ease, linear)
-                        alpha = func(alpha)
-                ax_off, ay_off = a.total_offset()
-                bx_off, by_off = b.total_offset()
-                x = (a.x + ax_off) * (1 - alpha) + (b.x + bx_off) * alpha
-                y = (a.y + ay_off) * (1 - alpha) + (b.y + by_off) * alpha
-                z = a.zoom * (1 - alpha) + b.zoom * alpha
-                ang = a.angle * (1 - alpha) + b.angle * alpha
-                return x, y, z, ang
-        kf = self.keyframes[-1]
-        return kf.x, kf.y, kf.zoom, kf.angle
+        # Monotonic queries (playback) advance the cached cursor instead of
+        # bisecting from scratch; seeks backward fall through to the bisect.
+        i, last_t = self._cursor
+        if time_ms >= last_t:
+            times = self._times
+            n = len(times)
+            while i < n and times[i] <= time_ms:
+                i += 1
+        else:
+            i = bisect_right(self._times, time_ms)
+        self._cursor = (i, time_ms)
+        a = self.keyframes[i - 1]
+        b = self.keyframes[i]
+        alpha = (time_ms - a.time) / (b.time - a.time)
+        # Linear segments (the common case) use alpha as-is; everything else
+        # goes through the pre-sampled table: one lookup and a lerp instead
+        # of re-dispatching on the ease name per frame.
+        if b.ease != "Linear" or b.custom_ease:
+            lut = b.ease_lut()
+            last = len(lut) - 1
+            if last > 0:
+                pos = alpha * last
+                li = min(int(pos), last - 1)
+                frac = pos - li
+                alpha = float(lut[li] * (1 - frac) + lut[li + 1] * frac)
+            else:
+                alpha = float(lut[0])
+        out = self._xyza[i - 1] * (1 - alpha) + self._xyza[i] * alpha
+        # Offset layers stay outside the SoA rows (they are per-keyframe
+        # lists); blending them separately is algebraically identical to
+        # offsetting before the lerp.
+        ax_off, ay_off = a.total_offset()
+        bx_off, by_off = b.total_offset()
+        x = float(out[0]) + ax_off * (1 - alpha) + bx_off * alpha
+        y = float(out[1]) + ay_off * (1 - alpha) + by_off * alpha
+        return x, y, float(out[2]), float(out[3])
+
+    def get_states_at(self, times_ms) -> np.ndarray:
+        """Interpolate camera state for a whole array of times at once.
+
+        Batch counterpart of :meth:`get_state_at` for path previews and
+        analytics: one ``searchsorted`` plus per-segment table gathers replace
+        a Python-level call per sample.  Returns an ``(N, 4)`` float32 array
+        of ``(x, y, zoom, angle)`` rows.
+        """
+        ts = np.asarray(times_ms, dtype=np.float64)
+        if len(self.keyframes) < 2:
+            out = np.empty((ts.shape[0], 4), dtype=np.float32)
+            if not self.keyframes:
+                out[:] = (0.0, 0.0, 100.0, 0.0)
+            else:
+                kf = self.keyframes[0]
+                ox, oy = kf.total_offset()
+                out[:] = (kf.x + ox, kf.y + oy, kf.zoom, kf.angle)
+            return out
+        t_arr = np.asarray(self._times, dtype=np.float64)
+        i = np.searchsorted(t_arr, ts, side="right").clip(1, len(t_arr) - 1)
+        # Duplicate timestamps produce zero-length segments; treat a sample
+        # bracketed by one as fully at the later keyframe (matching the scalar
+        # path, which never lands inside an empty segment) instead of 0/0.
+        dt = t_arr[i] - t_arr[i - 1]
+        alpha = np.where(dt > 0, (ts - t_arr[i - 1]) / np.where(dt > 0, dt, 1.0), 1.0)
+        alpha = np.clip(alpha, 0.0, 1.0)
+        # Eased alpha through each bracketing keyframe's cached table; samples
+        # are grouped by segment so every table is gathered in one shot.
+        eased = np.empty_like(alpha)
+        for seg in np.unique(i):
+            mask = i == seg
+            lut = self.keyframes[seg].ease_lut()
+            last = len(lut) - 1
+            if last > 0:
+                pos = alpha[mask] * last
+                li = np.minimum(pos.astype(np.int64), last - 1)
+                frac = pos - li
+                eased[mask] = lut[li] * (1 - frac) + lut[li + 1] * frac
+            else:
+                eased[mask] = lut[0]
+        w = eased[:, None].astype(np.float32)
+        out = self._xyza[i - 1] * (1 - w) + self._xyza[i] * w
+        offs = np.array(
+            [k.total_offset() for k in self.keyframes], dtype=np.float32
+        )
+        out[:, :2] += offs[i - 1] * (1 - w) + offs[i] * w
+        return out
 
     # Simple helpers for editing ------------------------------------------------
     def select_by_pos(self, pos: Tuple[float, float], radius: float = 5) -> None:
-        px, py = pos
-        for i, kf in enumerate(self.keyframes):
-            if (kf.x - px) ** 2 + (kf.y - py) ** 2 <= radius ** 2:
-                self.selected_index = i
-                return
-        self.selected_index = None
+        if not self.keyframes:
+            self.selected_index = None
+            return
+        # Nearest-within-radius over the SoA positions in one vector pass:
+        # clicks are rare, so a full distance computation beats maintaining a
+        # spatial index, and picking the minimum selects the closest marker
+        # when several overlap instead of the first in time order.
+        d = self._xyza[:, :2] - np.asarray(pos, dtype=np.float32)
+        d2 = (d * d).sum(axis=1)
+        i = int(np.argmin(d2))
+        self.selected_index = i if d2[i] <= radius * radius else None
 
     def current(self) -> Keyframe | None:
         if self.selected_index is None:
@@ -156,11 +393,15 @@ class CameraTrack:
         kf = self.keyframes[self.selected_index]
         kf.x += dx
         kf.y += dy
+        self._xyza[self.selected_index, 0] += dx
+        self._xyza[self.selected_index, 1] += dy
+        self._rev += 1
 
     def delete_selected(self) -> None:
         if self.selected_index is None:
             return
         del self.keyframes[self.selected_index]
+        self._rebuild_times()
         if self.keyframes:
             self.selected_index = min(self.selected_index, len(self.keyframes) - 1)
         else:
@@ -189,9 +430,7 @@ class CameraTrack:
             src.custom_ease[:] if src.custom_ease else None,
             src.offsets[:],
         )
-        self.keyframes.append(dup)
-        self.keyframes.sort(key=lambda k: k.time)
-        self.selected_index = self.keyframes.index(dup)
+        self._insert_keyframe(dup)
 
     def select_next(self) -> None:
         if not self.keyframes:
@@ -220,6 +459,7 @@ class CameraTrack:
             idx = 0
         kf.ease = keys[(idx + direction) % len(keys)]
         kf.custom_ease = None
+        kf.invalidate_ease()
 
 
 # ---------------------------------------------------------------------------
@@ -258,7 +498,7 @@ class ParamSlider:
              x: int, y: int) -> None:
         value = self.getter()
         label = f"{self.label}: {value:.2f}" if isinstance(value, float) else f"{self.label}: {value}"
-        txt = font.render(label, True, (230, 230, 230))
+        txt = _render_text(font, label, (230, 230, 230))
         surface.blit(txt, (x, y))
         y += 18
         width = 160
@@ -282,7 +522,7 @@ class Button:
 
     def draw(self, surface: pygame.Surface, font: pygame.font.Font) -> None:
         pygame.draw.rect(surface, (70, 70, 70), self.rect)
-        txt = font.render(self.text, True, (255, 255, 255))
+        txt = _render_text(font, self.text, (255, 255, 255))
         surface.blit(txt, txt.get_rect(center=self.rect.center))
 
 
@@ -296,10 +536,15 @@ class BezierEditor:
         self.render_cb = render_cb
         self.rect = pygame.Rect(0, 0, self.SIZE, self.SIZE)
         self.dragging: int | None = None
+        # Cached curve polyline keyed by (p1, p2, origin); control points only
+        # move while dragging, so the 21 Newton inversions per frame are
+        # wasted the rest of the time.
+        self._curve_cache: tuple | None = None
 
     def set_keyframe(self, kf: Keyframe) -> None:
         self.kf = kf
         self.kf.custom_ease = self.render_cb(self.kf)
+        self.kf.invalidate_ease()
 
     def _p1_pixel(self) -> Tuple[float, float]:
         return (
@@ -334,24 +579,28 @@ class BezierEditor:
             else:
                 self.kf.bezier_p2 = (x, y)
             self.kf.custom_ease = self.render_cb(self.kf)
+            self.kf.invalidate_ease()
 
     def draw(self, surface: pygame.Surface, font: pygame.font.Font, x: int, y: int) -> None:
         self.rect.topleft = (x, y)
         pygame.draw.rect(surface, (80, 80, 80), self.rect, 1)
-        # Draw curve
-        func = cubic_bezier(
-            self.kf.bezier_p1[0],
-            self.kf.bezier_p1[1],
-            self.kf.bezier_p2[0],
-            self.kf.bezier_p2[1],
-        )
-        pts = []
-        for i in range(21):
-            t = i / 20
-            px = x + t * self.rect.width
-            py = y + (1 - func(t)) * self.rect.height
-            pts.append((px, py))
-        pygame.draw.lines(surface, (200, 200, 0), False, pts, 2)
+        # Draw curve, resampling only when a control point or origin moved
+        key = (self.kf.bezier_p1, self.kf.bezier_p2, (x, y))
+        if self._curve_cache is None or self._curve_cache[0] != key:
+            func = cubic_bezier(
+                self.kf.bezier_p1[0],
+                self.kf.bezier_p1[1],
+                self.kf.bezier_p2[0],
+                self.kf.bezier_p2[1],
+            )
+            pts = []
+            for i in range(21):
+                t = i / 20
+                px = x + t * self.rect.width
+                py = y + (1 - func(t)) * self.rect.height
+                pts.append((px, py))
+            self._curve_cache = (key, pts)
+        pygame.draw.lines(surface, (200, 200, 0), False, self._curve_cache[1], 2)
         # Draw control points and handles
         p1 = self._p1_pixel()
         p2 = self._p2_pixel()
@@ -380,26 +629,32 @@ class ParamPanel:
         self.bezier_editor = None
         if kf is None:
             return
+
+        def set_param(obj, name, value, _kf=kf):
+            # Parameter edits must drop the keyframe's cached easing table.
+            setattr(obj, name, value)
+            _kf.invalidate_ease()
+
         if kf.ease == "Elastic":
             self.sliders.append(
                 ParamSlider(
                     "Oscillations", 1, 10,
                     lambda: kf.elastic_params.oscillations,
-                    lambda v: setattr(kf.elastic_params, "oscillations", int(v)),
+                    lambda v: set_param(kf.elastic_params, "oscillations", int(v)),
                 )
             )
             self.sliders.append(
                 ParamSlider(
                     "Decay", 0.1, 10.0,
                     lambda: kf.elastic_params.decay,
-                    lambda v: setattr(kf.elastic_params, "decay", v),
+                    lambda v: set_param(kf.elastic_params, "decay", v),
                 )
             )
             self.sliders.append(
                 ParamSlider(
                     "Phase", -math.pi, math.pi,
                     lambda: kf.elastic_params.phase,
-                    lambda v: setattr(kf.elastic_params, "phase", v),
+                    lambda v: set_param(kf.elastic_params, "phase", v),
                 )
             )
         elif "Back" in kf.ease:
@@ -407,7 +662,7 @@ class ParamPanel:
                 ParamSlider(
                     "Overshoot", 0.0, 5.0,
                     lambda: kf.back_params.overshoot,
-                    lambda v: setattr(kf.back_params, "overshoot", v),
+                    lambda v: set_param(kf.back_params, "overshoot", v),
                 )
             )
         elif "Bounce" in kf.ease:
@@ -415,19 +670,20 @@ class ParamPanel:
                 ParamSlider(
                     "n1", 5.0, 10.0,
                     lambda: kf.bounce_params.n1,
-                    lambda v: setattr(kf.bounce_params, "n1", v),
+                    lambda v: set_param(kf.bounce_params, "n1", v),
                 )
             )
             self.sliders.append(
                 ParamSlider(
                     "d1", 2.0, 4.0,
                     lambda: kf.bounce_params.d1,
-                    lambda v: setattr(kf.bounce_params, "d1", v),
+                    lambda v: set_param(kf.bounce_params, "d1", v),
                 )
             )
         elif kf.ease == "Bezier":
             self.bezier_editor = BezierEditor(kf, self.render_cb)
             kf.custom_ease = self.render_cb(kf)
+            kf.invalidate_ease()
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if self.bezier_editor:
@@ -442,7 +698,7 @@ class ParamPanel:
         rect = pygame.Rect(surface.get_width() - width, 0, width, surface.get_height())
         pygame.draw.rect(surface, self.BG, rect)
         y = 20
-        txt = font.render(f"Ease: {self.kf.ease}", True, (255, 255, 255))
+        txt = _render_text(font, f"Ease: {self.kf.ease}", (255, 255, 255))
         surface.blit(txt, (rect.x + 10, y))
         y += 40
         for s in self.sliders:
@@ -459,8 +715,15 @@ class Editor:
     def __init__(self, adofai_path: Path, audio_path: Path) -> None:
         pygame.init()
         pygame.mixer.init()
-        self.screen = pygame.display.set_mode((1200, 800))
+        # DOUBLEBUF lets SDL flip buffers instead of copying the frame;
+        # HWSURFACE is accepted for completeness but is a no-op under SDL2.
+        self.screen = pygame.display.set_mode(
+            (1200, 800), pygame.DOUBLEBUF | pygame.HWSURFACE
+        )
         pygame.display.set_caption("ADOFAI Camera Editor")
+        # The window is fixed-size; cache its dimensions rather than calling
+        # into SDL from every draw and event handler.
+        self._w, self._h = self.screen.get_size()
         self.clock = pygame.time.Clock()
 
         # Load level and audio
@@ -468,21 +731,30 @@ class Editor:
         self.audio_path = audio_path
         pygame.mixer.music.load(str(audio_path))
         self.track = CameraTrack()
+        self._compute_angles()
         self.tile_pos, self.tile_time = self._parse_tiles()
+        # Song end cached as a plain int: the playback loop compares against
+        # it every frame and should not re-index the timestamp array.
+        self._end_ms = int(self.tile_time[-1]) if len(self.tile_time) else 0
         # Determine centre of the tile layout so we can render it in the middle
         # of the screen rather than in the top left corner.
-        if self.tile_pos:
-            xs = [p[0] for p in self.tile_pos]
-            ys = [p[1] for p in self.tile_pos]
-            self.path_center = ((min(xs) + max(xs)) / 2, (min(ys) + max(ys)) / 2)
+        if len(self.tile_pos):
+            lo = self.tile_pos.min(axis=0)
+            hi = self.tile_pos.max(axis=0)
+            self.path_center = (float(lo[0] + hi[0]) / 2, float(lo[1] + hi[1]) / 2)
         else:
             self.path_center = (0.0, 0.0)
         self.render_offset = (0.0, 0.0)
+        self._tile_layer: pygame.Surface | None = None
+        self._tile_layer_offset: Tuple[float, float] | None = None
+        self._preview_cache: dict[int, tuple] = {}
+        self._timeline_cache: tuple | None = None
         self._init_keyframes_from_level()
 
         # state
         self.playing = False
         self.current_ms = 0
+        self._play_start_ms = 0
         self.font = pygame.font.SysFont("arial", 16)
         self.param_panel = ParamPanel(self._render_custom_ease)
         # ui buttons
@@ -491,55 +763,134 @@ class Editor:
             Button(pygame.Rect(120, 10, 100, 30), "Open Audio", self._open_audio),
             Button(pygame.Rect(230, 10, 100, 30), "Save", self._save_dialog),
         ]
+        # Pre-rendered keyframe markers: blitting a small sprite per keyframe
+        # batches through SDL far cheaper than a draw.circle call each.
+        self._kf_sprite = self._make_circle_sprite(self.KEYFRAME_COLOUR)
+        self._kf_sprite_sel = self._make_circle_sprite((255, 255, 0))
+        # Force an initial draw; afterwards frames are only rendered when
+        # input or playback marked the screen dirty.
+        self._dirty = True
         # timeline state
         self.timeline_height = 120
         self.timeline_rect = pygame.Rect(0, 0, 0, 0)
         self.timeline_scrubbing = False
         self.timeline_offset = 0  # left edge in milliseconds
         self.timeline_ms_per_px = 20  # default scale: 20ms per pixel
+        # One hidden Tk root shared by every dialog: creating and destroying
+        # an interpreter per prompt stalled the pygame loop for the full Tk
+        # start-up cost each time.
+        self._tk_root = Tk()
+        self._tk_root.withdraw()
 
     # ------------------------------------------------------------------
     # Level parsing
     # ------------------------------------------------------------------
-    def _parse_tiles(self) -> Tuple[List[Tuple[float, float]], List[int]]:
-        tile_pos: List[Tuple[float, float]] = []
-        tile_time: List[int] = []
+    DIRS = {
+        "D": 0, "E": 45, "W": 90, "Q": 135, "A": 180, "Z": 225,
+        "S": 270, "C": 315,
+        "R": 0, "T": 30, "Y": 60, "J": 120, "H": 150, "N": 210,
+        "M": 240, "V": 270, "B": 300,
+    }
+    # Every direction above is a multiple of 15 degrees, so cumulative path
+    # angles always land on one of 24 distinct headings.  Precomputing the
+    # (scaled) cos/sin for those headings turns per-tile trig into a table
+    # gather with exact values for the common axis-aligned segments.
+    _STEP_COS = np.cos(np.deg2rad(np.arange(0, 360, 15))) * 50
+    _STEP_SIN = np.sin(np.deg2rad(np.arange(0, 360, 15))) * 50
+    # 256-entry direction table so a whole pathData string can be decoded with
+    # one vectorised gather instead of a dict probe per character.  Unknown
+    # characters map to 0, matching DIRS.get(ch, 0).
+    _DIR_LUT = np.zeros(256, dtype=np.int64)
+    for _ch, _deg in DIRS.items():
+        _DIR_LUT[ord(_ch)] = _deg
+    del _ch, _deg
+
+    def _compute_angles(self) -> None:
+        """Cache the cumulative tile angles as a contiguous integer array.
+
+        Keeping the angles in a single ndarray (rather than re-deriving them
+        from ``pathData`` on demand) means repeated position computations are
+        pure cumsum work with no per-character lookups.  The cache is rebuilt
+        whenever a new level is loaded.
+        """
         path = self.level.pathData
+        if isinstance(path, str):
+            codes = np.frombuffer(path.encode("latin-1", "replace"), dtype=np.uint8)
+            rel = self._DIR_LUT[codes]
+        else:
+            # ``pathData`` may be the numeric ``angleData`` fallback.
+            dirs = self.DIRS
+            rel = np.fromiter(
+                (dirs.get(ch, 0) for ch in path), dtype=np.int64, count=len(path)
+            )
+        self._angles_deg = np.cumsum(rel)
+        # Invalidate any memoized tile layout derived from the old angles.
+        self._tiles_version = getattr(self, "_tiles_version", 0) + 1
+
+    def _parse_tiles(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return tile positions as an ``(N, 2)`` array and times in ms.
+
+        Returning contiguous arrays (rather than lists of tuples) lets the
+        drawing code translate and scale the whole path with single ufunc
+        calls instead of per-tile Python arithmetic.
+        """
+        # Camera editing only mutates keyframes, never the tiles themselves,
+        # so the parsed layout can be memoized until a new level is loaded.
+        cache = getattr(self, "_pos_cache", None)
+        if cache is not None and cache[0] == self._tiles_version:
+            return cache[1]
         bpm = self.level.settings.get("bpm", 120)
         spb = 60_000 / bpm
-        t = 0
-        x = y = ang = 0.0
-        DIRS = {
-            "D": 0, "E": 45, "W": 90, "Q": 135, "A": 180, "Z": 225,
-            "S": 270, "C": 315,
-            "R": 0, "T": 30, "Y": 60, "J": 120, "H": 150, "N": 210,
-            "M": 240, "V": 270, "B": 300,
-        }
-        for ch in path:
-            tile_pos.append((x, y))
-            tile_time.append(int(t))
-            d = DIRS.get(ch, 0)
-            ang += d
-            rad = math.radians(ang)
-            x += math.cos(rad) * 50
-            y += math.sin(rad) * 50
-            t += spb
-        return tile_pos, tile_time
+        deg = self._angles_deg
+        n = len(deg)
+        if n == 0:
+            pair = (np.empty((0, 2)), np.empty(0, dtype=np.int32))
+            self._pos_cache = (self._tiles_version, pair)
+            return pair
+        # One vectorised pass instead of per-tile math.cos/sin calls: the
+        # cumulative turn angle and the running position are both prefix sums,
+        # so the whole path reduces to np.cumsum over contiguous buffers.
+        heading = (deg[:-1] % 360) // 15
+        if _cumulate_positions is not None:
+            xs, ys = _cumulate_positions(heading, self._STEP_COS, self._STEP_SIN)
+        else:
+            xs = np.concatenate(([0.0], np.cumsum(self._STEP_COS[heading])))
+            ys = np.concatenate(([0.0], np.cumsum(self._STEP_SIN[heading])))
+        times = np.concatenate(([0.0], np.cumsum(np.full(n - 1, spb))))
+        # Accumulate in float64 to avoid drift over long paths, then store as
+        # float32: the worst-case rounding from the downcast is far below a
+        # pixel while halving the bandwidth of every downstream draw pass.
+        # int32 halves the footprint of the timestamp array; level lengths stay
+        # far below the 2**31 ms (~24 day) range of the narrower dtype.
+        pair = (np.column_stack((xs, ys)).astype(np.float32), times.astype(np.int32))
+        self._pos_cache = (self._tiles_version, pair)
+        return pair
 
     def _init_keyframes_from_level(self) -> None:
         """Populate :class:`CameraTrack` from level actions and settings."""
-        self.track.keyframes.clear()
         # Base keyframe from level settings so the editor always starts with a
         # sensible camera position even if the level has no MoveCamera events.
         settings = self.level.settings
         pos = settings.get("position", [0, 0])
         zoom = settings.get("zoom", 100)
         angle = settings.get("angleOffset", 0)
-        self.track.keyframes.append(Keyframe(0, pos[0], pos[1], zoom, angle))
+        # Build into a local list with bound names; levels can carry thousands
+        # of actions and the attribute chain per iteration adds up.
+        keyframes = [Keyframe(0, pos[0], pos[1], zoom, angle)]
+        append = keyframes.append
+        # Partition the action list in the same pass: everything that is not a
+        # MoveCamera event is kept verbatim for save(), so saving does not
+        # have to re-filter the full action list.
+        static_actions: List[dict] = []
+        keep = static_actions.append
+        tile_time = self.tile_time
+        last_tile = len(tile_time) - 1
         for act in self.level.actions:
-            if act.get("eventType") == "MoveCamera":
+            if act.get("eventType") != _MOVE_CAMERA:
+                keep(act)
+            else:
                 floor = act.get("floor", 1)
-                t = self.tile_time[min(floor - 1, len(self.tile_time) - 1)]
+                t = int(tile_time[min(floor - 1, last_tile)])
                 pos = act.get("position", [0, 0])
                 zoom = act.get("zoom", 100)
                 angle = act.get("angleOffset", 0)
@@ -552,7 +903,10 @@ class Editor:
                     kf.bezier_p2 = (bez[2], bez[3])
                 if "customEase" in act:
                     kf.custom_ease = act["customEase"]
-                else:
+                elif kf.ease == "Bezier":
+                    # Bezier has no analytic entry in the easing dispatch, so
+                    # its curve must be rendered up front; every other ease is
+                    # evaluated exactly on demand during interpolation.
                     kf.custom_ease = self._render_custom_ease(kf)
                 if ease == "Elastic" and "elasticParams" in act:
                     ep = act["elasticParams"]
@@ -567,8 +921,10 @@ class Editor:
                 if "Bounce" in ease and "bounceParams" in act:
                     bp2 = act["bounceParams"]
                     kf.bounce_params = BounceParams(bp2.get("n1", 7.5625), bp2.get("d1", 2.75))
-                self.track.keyframes.append(kf)
-        self.track.keyframes.sort(key=lambda k: k.time)
+                append(kf)
+        keyframes.sort(key=lambda k: k.time)
+        self.track.set_keyframes(keyframes)
+        self._static_actions = static_actions
 
     # ------------------------------------------------------------------
     # Main loop and drawing
@@ -578,19 +934,39 @@ class Editor:
             dt = self.clock.tick(60)
             self._handle_events()
             if self.playing:
-                self.current_ms += dt
-                if self.current_ms >= self.tile_time[-1]:
+                # Follow the mixer clock rather than accumulating frame
+                # deltas: tick() jitter would drift against the audio, and
+                # redrawing is skipped when the song position has not
+                # advanced a whole millisecond.
+                pos = pygame.mixer.music.get_pos()
+                if pos >= 0:
+                    new_ms = self._play_start_ms + pos
+                else:  # no audio loaded / stream ended; keep advancing
+                    new_ms = self.current_ms + dt
+                if new_ms != self.current_ms:
+                    self.current_ms = new_ms
+                    self._ensure_current_visible()
+                    self._dirty = True
+                if self.current_ms >= self._end_ms:
+                    self.current_ms = self._end_ms
                     self.playing = False
-                self._ensure_current_visible()
-            self._draw()
+                    self._dirty = True
+            # Idle frames (paused, no input) skip the whole draw pass;
+            # clock.tick above still caps the loop at 60 Hz.
+            if self._dirty:
+                self._draw()
+                self._dirty = False
 
     # ------------------------------------------------------------------
     def _handle_events(self) -> None:
         for event in pygame.event.get():
+            # Any input may change what is on screen; redraw on next tick.
+            self._dirty = True
             self.param_panel.handle_event(event)
             for btn in self.buttons:
                 btn.handle_event(event)
             if event.type == pygame.QUIT:
+                self._tk_root.destroy()
                 pygame.quit()
                 raise SystemExit
             if event.type == pygame.KEYDOWN:
@@ -600,6 +976,11 @@ class Editor:
                     x, y, z, a = self.track.get_state_at(self.current_ms)
                     self.track.add_keyframe(self.current_ms, x, y, z, a)
                 elif event.key in (pygame.K_DELETE, pygame.K_BACKSPACE):
+                    # Drop the cached preview surface so deleted keyframes do
+                    # not keep pinning it for the rest of the session.
+                    kf = self.track.current()
+                    if kf is not None:
+                        self._preview_cache.pop(id(kf), None)
                     self.track.delete_selected()
                 elif event.key == pygame.K_d and event.mod & pygame.KMOD_CTRL:
                     self.track.duplicate_selected()
@@ -634,7 +1015,7 @@ class Editor:
                     self._set_time_from_timeline(mx)
                     self.timeline_scrubbing = True
                     self.playing = False
-                elif mx < self.screen.get_width() - 220:
+                elif mx < self._w - 220:
                     wx, wy = self._screen_to_world(mx, my)
                     self.track.select_by_pos((wx, wy))
             elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
@@ -643,7 +1024,7 @@ class Editor:
                 self._set_time_from_timeline(event.pos[0])
             elif event.type == pygame.MOUSEWHEEL:
                 if self.timeline_rect.collidepoint(pygame.mouse.get_pos()):
-                    max_off = max(0, self.tile_time[-1] - self._timeline_visible_ms())
+                    max_off = max(0, self._end_ms - self._timeline_visible_ms())
                     self.timeline_offset -= event.y * 200  # scroll ~0.2s per notch
                     self.timeline_offset = max(0, min(self.timeline_offset, max_off))
         self.param_panel.set_keyframe(self.track.current())
@@ -652,6 +1033,9 @@ class Editor:
         if self.playing:
             pygame.mixer.music.pause()
         else:
+            # get_pos() counts from this play() call, so remember where in
+            # the song it corresponds to.
+            self._play_start_ms = self.current_ms
             pygame.mixer.music.play(start=self.current_ms / 1000.0)
         self.playing = not self.playing
 
@@ -663,14 +1047,14 @@ class Editor:
 
     def _set_time_from_timeline(self, mx: int) -> None:
         panel_w = 220
-        width = self.screen.get_width() - panel_w
+        width = self._w - panel_w
         self.current_ms = self.timeline_offset + int(mx * self.timeline_ms_per_px)
-        self.current_ms = max(0, min(self.current_ms, self.tile_time[-1]))
+        self.current_ms = max(0, min(self.current_ms, self._end_ms))
         self._ensure_current_visible()
 
     def _timeline_visible_ms(self) -> int:
         panel_w = 220
-        width = self.screen.get_width() - panel_w
+        width = self._w - panel_w
         return int(width * self.timeline_ms_per_px)
 
     def _ensure_current_visible(self) -> None:
@@ -679,7 +1063,7 @@ class Editor:
             self.timeline_offset = self.current_ms
         elif self.current_ms > self.timeline_offset + vis:
             self.timeline_offset = self.current_ms - vis
-        max_off = max(0, self.tile_time[-1] - vis)
+        max_off = max(0, self._end_ms - vis)
         self.timeline_offset = max(0, min(self.timeline_offset, max_off))
 
     def _world_to_screen(self, x: float, y: float) -> Tuple[int, int]:
@@ -690,35 +1074,76 @@ class Editor:
         ox, oy = self.render_offset
         return x - ox, y - oy
 
+    @staticmethod
+    def _make_circle_sprite(colour: Tuple[int, int, int], radius: int = 5) -> pygame.Surface:
+        size = radius * 2 + 1
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, colour, (radius, radius), radius)
+        return sprite.convert_alpha()
+
+    def _build_tile_layer(self) -> None:
+        """Rasterise the (static) tile path into a reusable overlay surface."""
+        layer = pygame.Surface((self._w, self._h), pygame.SRCALPHA)
+        ox, oy = self.render_offset
+        pts = (self.tile_pos + np.array([ox, oy], dtype=np.float32)).astype(int)
+        # Cull offscreen tiles: for sprawling levels most of the path lies
+        # outside the window, so only submit the visible span (plus a margin
+        # for the node circles) instead of letting SDL clip every primitive.
+        w, h = layer.get_size()
+        margin = 8
+        visible = (
+            (pts[:, 0] >= -margin) & (pts[:, 0] < w + margin)
+            & (pts[:, 1] >= -margin) & (pts[:, 1] < h + margin)
+        )
+        idx = np.nonzero(visible)[0]
+        if len(idx):
+            # Keep the polyline connected through brief offscreen excursions
+            # by drawing the full span between first and last visible tile.
+            lo, hi = int(idx[0]), int(idx[-1])
+            span = pts[max(0, lo - 1):hi + 2]
+            if len(span) > 1:
+                pygame.draw.lines(layer, self.TILE_COLOUR, False, span.tolist(), 2)
+            for px, py in pts[idx].tolist():
+                pygame.draw.circle(layer, (100, 100, 100), (px, py), 6)
+                pygame.draw.circle(layer, (230, 230, 230), (px, py), 4)
+        self._tile_layer = layer.convert_alpha()
+        self._tile_layer_offset = self.render_offset
+
     # ------------------------------------------------------------------
     def _draw(self) -> None:
         self.screen.fill((30, 30, 30))
         # compute offset so tiles are centered in remaining screen area
         panel_w = 220
-        canvas_w = self.screen.get_width() - panel_w
-        canvas_h = self.screen.get_height() - self.timeline_height
+        canvas_w = self._w - panel_w
+        canvas_h = self._h - self.timeline_height
         off_x = canvas_w // 2 - self.path_center[0]
         off_y = canvas_h // 2 - self.path_center[1]
         self.render_offset = (off_x, off_y)
 
-        # Draw tiles and nicer tile nodes
-        if self.tile_pos:
-            pts = [self._world_to_screen(x, y) for x, y in self.tile_pos]
-            pygame.draw.lines(self.screen, self.TILE_COLOUR, False, pts, 2)
-            for px, py in pts:
-                pygame.draw.circle(self.screen, (100, 100, 100), (int(px), int(py)), 6)
-                pygame.draw.circle(self.screen, (230, 230, 230), (int(px), int(py)), 4)
+        # Draw tiles and nicer tile nodes.  The path never moves while a level
+        # is loaded, so it is rasterised once into a cached layer and blitted.
+        if len(self.tile_pos):
+            if self._tile_layer is None or self._tile_layer_offset != self.render_offset:
+                self._build_tile_layer()
+            self.screen.blit(self._tile_layer, (0, 0))
         # Draw player position
-        if self.tile_time:
-            idx = max(0, bisect_right(self.tile_time, self.current_ms) - 1)
+        if len(self.tile_time):
+            idx = max(0, int(np.searchsorted(self.tile_time, self.current_ms, side="right")) - 1)
             px, py = self._world_to_screen(*self.tile_pos[idx])
             pygame.draw.circle(self.screen, (0, 200, 255), (int(px), int(py)), 8)
             pygame.draw.circle(self.screen, (255, 255, 255), (int(px), int(py)), 8, 2)
-        # Draw keyframes
+        # Draw keyframes as batched sprite blits
+        sel = self.track.selected_index
+        sw, sh = self._w, self._h
+        blits = []
         for i, kf in enumerate(self.track.keyframes):
-            colour = (255, 255, 0) if i == self.track.selected_index else self.KEYFRAME_COLOUR
             sx, sy = self._world_to_screen(kf.x, kf.y)
-            pygame.draw.circle(self.screen, colour, (sx, sy), 5)
+            if sx < -5 or sx > sw + 5 or sy < -5 or sy > sh + 5:
+                continue
+            sprite = self._kf_sprite_sel if i == sel else self._kf_sprite
+            blits.append((sprite, (sx - 5, sy - 5)))
+        if blits:
+            self.screen.blits(blits)
         # Draw camera position
         cam_x, cam_y, _z, _a = self.track.get_state_at(self.current_ms)
         cam_col = self.RENDER_CAM_COLOUR if self.playing else self.CAM_COLOUR
@@ -738,14 +1163,14 @@ class Editor:
 
     def _draw_timeline(self) -> None:
         panel_w = 220
-        width = self.screen.get_width() - panel_w
-        y = self.screen.get_height() - self.timeline_height
+        width = self._w - panel_w
+        y = self._h - self.timeline_height
         self.timeline_rect = pygame.Rect(0, y, width, self.timeline_height)
         pygame.draw.rect(self.screen, (60, 60, 60), self.timeline_rect)
         start = self.timeline_offset
         visible = self._timeline_visible_ms()
         end = start + visible
-        total = self.tile_time[-1] if self.tile_time else 1
+        total = self._end_ms or 1
         row_h = self.timeline_height // 4
         params = [
             ("x", (255, 80, 80)),
@@ -753,6 +1178,26 @@ class Editor:
             ("zoom", (80, 80, 255)),
             ("angle", (255, 255, 80)),
         ]
+        # One batched interpolation covers all four parameter rows; the
+        # previous per-pixel get_state_at calls dominated the timeline cost.
+        # The sampled block is reused as-is until the track, an easing table
+        # or the visible range changes.
+        sample = 200
+        key = (
+            self.track._rev,
+            start,
+            visible,
+            width,
+            tuple(id(kf._ease_lut) for kf in self.track.keyframes),
+        )
+        cached = self._timeline_cache
+        if cached is None or cached[0] != key:
+            ts = np.linspace(start, start + visible, sample)
+            states = self.track.get_states_at(ts.astype(np.int64))
+            self._timeline_cache = (key, states)
+        else:
+            states = cached[1]
+        xs_px = (np.arange(sample) / (sample - 1) * width).astype(int)
         for idx, (attr, colour) in enumerate(params):
             row_top = y + idx * row_h
             pygame.draw.line(
@@ -765,24 +1210,16 @@ class Editor:
             if vmin == vmax:
                 vmin -= 1
                 vmax += 1
-            sample = 200
-            points: list[tuple[int, float]] = []
-            for i in range(sample):
-                t = start + i / (sample - 1) * visible
-                x, y_val, z, a = self.track.get_state_at(int(t))
-                value = {"x": x, "y": y_val, "zoom": z, "angle": a}[attr]
-                px = int(i / (sample - 1) * width)
-                py = row_top + row_h - (value - vmin) / (vmax - vmin) * row_h
-                points.append((px, py))
-            if points:
-                pygame.draw.lines(self.screen, colour, False, points, 2)
+            pys = row_top + row_h - (states[:, idx] - vmin) / (vmax - vmin) * row_h
+            points = np.column_stack((xs_px, pys)).tolist()
+            pygame.draw.lines(self.screen, colour, False, points, 2)
             for kf in self.track.keyframes:
                 if start <= kf.time <= end:
                     px = int((kf.time - start) / visible * width)
                     val = getattr(kf, attr)
                     py = row_top + row_h - (val - vmin) / (vmax - vmin) * row_h
                     pygame.draw.circle(self.screen, colour, (px, int(py)), 3)
-            label = self.font.render(attr, True, colour)
+            label = _render_text(self.font, attr, colour)
             self.screen.blit(label, (5, row_top + 2))
         scrub_x = int((self.current_ms - start) / visible * width)
         pygame.draw.line(
@@ -797,19 +1234,26 @@ class Editor:
         idx = self.track.selected_index
         if idx is None or idx == 0:
             return
-        a = self.track.keyframes[idx - 1]
         b = self.track.keyframes[idx]
         rect = pygame.Rect(10, 10, 200, 100)
-        pygame.draw.rect(self.screen, (50, 50, 50), rect, 1)
-        curve = self._render_custom_ease(b, samples=100)
-        points = []
-        for i, y in enumerate(curve):
-            t = i / (len(curve) - 1)
-            px = rect.left + t * rect.width
-            py = rect.bottom - y * rect.height
-            points.append((px, py))
-        if points:
-            pygame.draw.lines(self.screen, (0, 255, 0), False, points, 2)
+        # The preview only changes when the keyframe's easing table is
+        # rebuilt, so the rasterised curve is cached per keyframe and keyed
+        # on the table's identity.
+        lut = b.ease_lut()
+        cached = self._preview_cache.get(id(b))
+        if cached is None or cached[0] is not lut:
+            surf = pygame.Surface(rect.size, pygame.SRCALPHA)
+            pygame.draw.rect(surf, (50, 50, 50), surf.get_rect(), 1)
+            last = len(lut) - 1
+            points = [
+                (i / last * rect.width, (1 - float(y)) * rect.height)
+                for i, y in enumerate(lut)
+            ] if last > 0 else []
+            if points:
+                pygame.draw.lines(surf, (0, 255, 0), False, points, 2)
+            cached = (lut, surf.convert_alpha())
+            self._preview_cache[id(b)] = cached
+        self.screen.blit(cached[1], rect.topleft)
 
 
 # ---------------------------------------------------------------------------
@@ -817,25 +1261,30 @@ class Editor:
 # ---------------------------------------------------------------------------
 
     def save(self, out_path: Path) -> None:
-        actions = [a for a in self.level.actions
-                   if a.get("eventType") != "MoveCamera"]
-        for kf in self.track.keyframes:
-            floor = self._floor_for_time(kf.time)
+        # Non-camera actions were split off when the level was loaded.
+        actions = list(self._static_actions)
+        # Keyframes are kept sorted, so one searchsorted maps every keyframe
+        # time to its floor instead of a binary search per keyframe.
+        kf_times = [kf.time for kf in self.track.keyframes]
+        floors = np.minimum(
+            np.searchsorted(self.tile_time, kf_times) + 1, len(self.tile_time)
+        ).tolist()
+        # Keyframes sharing an ease and parameters produce identical curves;
+        # deduplicating lets them share one list instead of 60 floats each.
+        unique_curves: Dict[tuple, List[float]] = {}
+        for kf, floor in zip(self.track.keyframes, floors):
             curve = self._render_custom_ease(kf)
+            curve = unique_curves.setdefault(tuple(curve), curve)
             kf.custom_ease = curve
-            ease_val = kf.ease if kf.ease != "Bezier" else "Linear"
+            kf.invalidate_ease()
             ox, oy = kf.total_offset()
-            act = {
-                "floor": floor,
-                "eventType": "MoveCamera",
-                "duration": 0,
-                "relativeTo": "World",
-                "position": [kf.x + ox, kf.y + oy],
-                "zoom": kf.zoom,
-                "angleOffset": kf.angle,
-                "ease": ease_val,
-                "customEase": curve,
-            }
+            act = _BASE_ACT.copy()
+            act["floor"] = floor
+            act["position"] = [kf.x + ox, kf.y + oy]
+            act["zoom"] = kf.zoom
+            act["angleOffset"] = kf.angle
+            act["ease"] = kf.ease if kf.ease != "Bezier" else "Linear"
+            act["customEase"] = curve
             if kf.ease == "Bezier":
                 act["bezier"] = [
                     kf.bezier_p1[0],
@@ -859,81 +1308,85 @@ class Editor:
                     "d1": kf.bounce_params.d1,
                 }
             actions.append(act)
+        # One stable sort restores canonical floor order instead of weaving
+        # the camera actions back into place one by one.
+        actions.sort(key=lambda a: a.get("floor", 0))
         self.level.actions = actions
         self.level.write(out_path)
 
     def _floor_for_time(self, t: int) -> int:
-        for i, tm in enumerate(self.tile_time):
-            if tm >= t:
-                return i + 1
-        return len(self.tile_time)
+        # tile_time is monotonic, so the first tile at-or-after ``t`` can be
+        # found with a binary search instead of a linear scan per keyframe.
+        return min(int(np.searchsorted(self.tile_time, t)) + 1, len(self.tile_time))
 
     def _render_custom_ease(self, kf: Keyframe, samples: int = 60) -> List[float]:
-        """Render the easing curve for ``kf`` using only built-in functions."""
-        t_values = [i / (samples - 1) for i in range(samples)]
-        if kf.ease == "Elastic":
-            func = lambda t: elastic(t, kf.elastic_params)
-        elif "Back" in kf.ease:
-            if kf.ease == "EaseInBack":
-                func = lambda t: ease_in_back(t, kf.back_params)
-            elif kf.ease == "EaseOutBack":
-                func = lambda t: ease_out_back(t, kf.back_params)
-            else:
-                func = lambda t: ease_in_out_back(t, kf.back_params)
-        elif "Bounce" in kf.ease:
-            if kf.ease == "EaseInBounce":
-                func = lambda t: ease_in_bounce(t, kf.bounce_params)
-            elif kf.ease == "EaseOutBounce":
-                func = lambda t: ease_out_bounce(t, kf.bounce_params)
-            else:
-                func = lambda t: ease_in_out_bounce(t, kf.bounce_params)
-        elif kf.ease == "Bezier":
-            func = cubic_bezier(
-                kf.bezier_p1[0],
-                kf.bezier_p1[1],
-                kf.bezier_p2[0],
-                kf.bezier_p2[1],
-            )
-        else:
-            func = EASING_FUNCTIONS.get(kf.ease, linear)
-        return [func(t) for t in t_values]
+        """Render the easing curve for ``kf`` using only built-in functions.
+
+        The result is cached on the keyframe keyed by everything that feeds
+        the curve, so repeated saves of an unedited keyframe skip the math.
+        """
+        key = (
+            kf.ease,
+            samples,
+            kf.bezier_p1,
+            kf.bezier_p2,
+            kf.elastic_params.oscillations,
+            kf.elastic_params.decay,
+            kf.elastic_params.phase,
+            kf.back_params.overshoot,
+            kf.bounce_params.n1,
+            kf.bounce_params.d1,
+        )
+        if kf._curve_cache is not None and kf._curve_cache[0] == key:
+            return kf._curve_cache[1]
+        curve = kf.render_curve(samples)
+        kf._curve_cache = (key, curve)
+        return curve
 
     # ------------------------------------------------------------------
     # File operations and prompts
     # ------------------------------------------------------------------
 
     def _open_level(self) -> None:
-        root = Tk(); root.withdraw()
-        path = filedialog.askopenfilename(filetypes=[("ADOFAI", "*.adofai")])
-        root.destroy()
+        path = filedialog.askopenfilename(
+            parent=self._tk_root, filetypes=[("ADOFAI", "*.adofai")]
+        )
         if not path:
             return
         self.level = Level.load(path)
         self.track = CameraTrack()
+        self._compute_angles()
         self.tile_pos, self.tile_time = self._parse_tiles()
-        if self.tile_pos:
-            xs = [p[0] for p in self.tile_pos]
-            ys = [p[1] for p in self.tile_pos]
-            self.path_center = ((min(xs) + max(xs)) / 2, (min(ys) + max(ys)) / 2)
+        self._end_ms = int(self.tile_time[-1]) if len(self.tile_time) else 0
+        if len(self.tile_pos):
+            lo = self.tile_pos.min(axis=0)
+            hi = self.tile_pos.max(axis=0)
+            self.path_center = (float(lo[0] + hi[0]) / 2, float(lo[1] + hi[1]) / 2)
         else:
             self.path_center = (0.0, 0.0)
         self.render_offset = (0.0, 0.0)
+        self._tile_layer = None
+        self._tile_layer_offset = None
+        self._preview_cache.clear()
+        self._timeline_cache = None
         self._init_keyframes_from_level()
         self.current_ms = 0
         self.timeline_offset = 0
 
     def _open_audio(self) -> None:
-        root = Tk(); root.withdraw()
-        path = filedialog.askopenfilename(filetypes=[("Audio", "*.ogg *.mp3 *.wav")])
-        root.destroy()
+        path = filedialog.askopenfilename(
+            parent=self._tk_root, filetypes=[("Audio", "*.ogg *.mp3 *.wav")]
+        )
         if not path:
             return
         pygame.mixer.music.load(path)
 
     def _save_dialog(self) -> None:
-        root = Tk(); root.withdraw()
-        path = filedialog.asksaveasfilename(defaultextension=".adofai", filetypes=[("ADOFAI", "*.adofai")])
-        root.destroy()
+        path = filedialog.asksaveasfilename(
+            parent=self._tk_root,
+            defaultextension=".adofai",
+            filetypes=[("ADOFAI", "*.adofai")],
+        )
         if not path:
             return
         self.save(Path(path))
@@ -942,12 +1395,13 @@ class Editor:
         kf = self.track.current()
         if kf is None:
             return
-        root = Tk(); root.withdraw()
         current = getattr(kf, field)
-        val = simpledialog.askfloat("Set value", f"Enter {field}", initialvalue=current)
-        root.destroy()
+        val = simpledialog.askfloat(
+            "Set value", f"Enter {field}", initialvalue=current, parent=self._tk_root
+        )
         if val is not None:
             setattr(kf, field, val)
+            self.track.sync_selected()
 
 
 # ---------------------------------------------------------------------------
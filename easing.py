@@ -14,12 +14,19 @@ from dataclasses import dataclass
 import math
 from typing import Callable
 
+try:  # NumPy is optional and only needed for the array-valued sampling API.
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
 # The goal of this module is to mirror the variety of easing curves commonly
 # available in professional animation tools.  Each function accepts a ``t``
 # parameter in the range ``[0, 1]`` and returns a value in the same range.
 
-# Only standard library modules are used so the functions can be imported by
-# other scripts without pulling in heavy dependencies.
+# Only standard library modules are required, so the functions can be imported
+# by other scripts without pulling in heavy dependencies.  When NumPy happens
+# to be installed an additional array-valued sampling API is exposed at the
+# bottom of the module.
 
 # ---------------------------------------------------------------------------
 # Basic easing functions
@@ -134,7 +141,7 @@ def ease_in_out_circ(t: float) -> float:
     return (math.sqrt(1 - (-2 * t + 2) ** 2) + 1) / 2
 
 
-@dataclass
+@dataclass(slots=True)
 class BackParams:
     overshoot: float = 1.70158
 
@@ -159,7 +166,7 @@ def ease_in_out_back(t: float, params: BackParams = BackParams()) -> float:
     return ((2 * t - 2) ** 2 * ((c2 + 1) * (t * 2 - 2) + c2) + 2) / 2
 
 
-@dataclass
+@dataclass(slots=True)
 class BounceParams:
     n1: float = 7.5625
     d1: float = 2.75
@@ -193,7 +200,7 @@ def ease_in_out_bounce(t: float, params: BounceParams = BounceParams()) -> float
 # Elastic easing
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class ElasticParams:
     oscillations: int = 3
     decay: float = 3.0
@@ -223,34 +230,72 @@ def elastic(t: float, params: ElasticParams = ElasticParams()) -> float:
 
 
 def cubic_bezier(p1x: float, p1y: float, p2x: float, p2y: float) -> Callable[[float], float]:
-    """Return a cubic bezier easing function defined by control points."""
+    """Return a cubic bezier easing function defined by control points.
+
+    The x(t) inversion uses the standard hybrid scheme: a small sample table
+    built once per curve brackets the parameter, Newton-Raphson refines it
+    where the local slope is healthy and bisection takes over on flat spots.
+    This keeps per-call cost bounded regardless of how degenerate the control
+    points are.
+    """
+
+    # Horner-form polynomial coefficients for x(u) and y(u).
+    ax = 1.0 - 3.0 * p2x + 3.0 * p1x
+    bx = 3.0 * p2x - 6.0 * p1x
+    cx = 3.0 * p1x
+    ay = 1.0 - 3.0 * p2y + 3.0 * p1y
+    by = 3.0 * p2y - 6.0 * p1y
+    cy = 3.0 * p1y
+
+    def calc_x(u: float) -> float:
+        return ((ax * u + bx) * u + cx) * u
+
+    def calc_y(u: float) -> float:
+        return ((ay * u + by) * u + cy) * u
+
+    def slope_x(u: float) -> float:
+        return (3.0 * ax * u + 2.0 * bx) * u + cx
+
+    # Coarse x(t) samples for bracketing the Newton start point.
+    table_size = 11
+    step = 1.0 / (table_size - 1)
+    samples = [calc_x(i * step) for i in range(table_size)]
 
     def func(t: float) -> float:
-        # Invert x(t) using Newton-Raphson iterations
-        u = t
-        for _ in range(5):
-            x = (
-                (1 - u) ** 3 * 0
-                + 3 * (1 - u) ** 2 * u * p1x
-                + 3 * (1 - u) * u ** 2 * p2x
-                + u ** 3
-            )
-            dx = (
-                3 * (1 - u) ** 2 * (p1x - 0)
-                + 6 * (1 - u) * u * (p2x - p1x)
-                + 3 * u ** 2 * (1 - p2x)
-            )
-            if dx == 0:
-                break
-            u -= (x - t) / dx
-            u = max(0.0, min(1.0, u))
-        y = (
-            (1 - u) ** 3 * 0
-            + 3 * (1 - u) ** 2 * u * p1y
-            + 3 * (1 - u) * u ** 2 * p2y
-            + u ** 3
-        )
-        return y
+        if t <= 0.0:
+            return 0.0
+        if t >= 1.0:
+            return 1.0
+        # Bracket t within the sample table for a good initial guess.
+        i = 1
+        while i < table_size - 1 and samples[i] <= t:
+            i += 1
+        lo = (i - 1) * step
+        dist = samples[i] - samples[i - 1]
+        if dist > 0:
+            u = lo + step * (t - samples[i - 1]) / dist
+        else:
+            u = lo
+        slope = slope_x(u)
+        if slope >= 0.001:
+            for _ in range(4):
+                x = calc_x(u) - t
+                slope = slope_x(u)
+                if slope == 0.0:
+                    break
+                u -= x / slope
+        else:
+            # Flat segment: bisect within the bracket.
+            hi = lo + step
+            for _ in range(10):
+                u = (lo + hi) / 2
+                if calc_x(u) < t:
+                    lo = u
+                else:
+                    hi = u
+                if hi - lo < 1e-7:
+                    break
+        return calc_y(u)
 
     return func
 
@@ -287,3 +332,105 @@ EASING_FUNCTIONS: dict[str, Callable[[float], float]] = {
     # Elastic is handled separately due to parameters
 }
 
+# ---------------------------------------------------------------------------
+# Array-valued easing (optional, requires NumPy)
+# ---------------------------------------------------------------------------
+#
+# Sampling an easing curve (for LUTs, previews or customEase export) calls the
+# scalar functions above once per sample.  The variants below accept a whole
+# ndarray of ``t`` values and evaluate the curve in a handful of ufunc calls.
+# The purely polynomial functions broadcast as-is, so only the branching and
+# ``math.*``-based curves need dedicated implementations.
+
+if np is not None:
+
+    def elastic_array(t, params: ElasticParams = ElasticParams()):
+        """Vectorised :func:`elastic` over an ndarray of ``t`` values."""
+        sin_term = np.sin(params.oscillations * 2 * np.pi * t + params.phase)
+        decay_term = np.exp(-params.decay * t)
+        return np.where((t == 0) | (t == 1), t, 1 - sin_term * decay_term)
+
+    def ease_in_out_back_array(t, params: BackParams = BackParams()):
+        c1 = params.overshoot
+        c2 = c1 * 1.525
+        lo = ((2 * t) ** 2 * ((c2 + 1) * 2 * t - c2)) / 2
+        hi = ((2 * t - 2) ** 2 * ((c2 + 1) * (t * 2 - 2) + c2) + 2) / 2
+        return np.where(t < 0.5, lo, hi)
+
+    def ease_out_bounce_array(t, params: BounceParams = BounceParams()):
+        n1 = params.n1
+        d1 = params.d1
+        t2 = t - 1.5 / d1
+        t3 = t - 2.25 / d1
+        t4 = t - 2.625 / d1
+        return np.select(
+            [t < 1 / d1, t < 2 / d1, t < 2.5 / d1],
+            [n1 * t * t, n1 * t2 * t2 + 0.75, n1 * t3 * t3 + 0.9375],
+            n1 * t4 * t4 + 0.984375,
+        )
+
+    def ease_in_bounce_array(t, params: BounceParams = BounceParams()):
+        return 1 - ease_out_bounce_array(1 - t, params)
+
+    def ease_in_out_bounce_array(t, params: BounceParams = BounceParams()):
+        return np.where(
+            t < 0.5,
+            (1 - ease_out_bounce_array(1 - 2 * t, params)) / 2,
+            (1 + ease_out_bounce_array(2 * t - 1, params)) / 2,
+        )
+
+    # ``np.where`` evaluates both branches, so expressions feeding sqrt are
+    # clamped to their domain to avoid NaNs from the untaken branch.
+    EASING_ARRAY_FUNCTIONS: dict[str, Callable] = {
+        "Linear": linear,
+        "EaseInQuad": ease_in_quad,
+        "EaseOutQuad": ease_out_quad,
+        "EaseInOutQuad": lambda t: np.where(t < 0.5, 2 * t * t, -1 + (4 - 2 * t) * t),
+        "EaseInCubic": ease_in_cubic,
+        "EaseOutCubic": ease_out_cubic,
+        "EaseInOutCubic": lambda t: np.where(
+            t < 0.5, 4 * t ** 3, 1 - (-2 * t + 2) ** 3 / 2
+        ),
+        "EaseInQuart": ease_in_quart,
+        "EaseOutQuart": ease_out_quart,
+        "EaseInOutQuart": lambda t: np.where(
+            t < 0.5, 8 * t ** 4, 1 - (-2 * t + 2) ** 4 / 2
+        ),
+        "EaseInQuint": ease_in_quint,
+        "EaseOutQuint": ease_out_quint,
+        "EaseInOutQuint": lambda t: np.where(
+            t < 0.5, 16 * t ** 5, 1 - (-2 * t + 2) ** 5 / 2
+        ),
+        "EaseInSine": lambda t: 1 - np.cos((t * np.pi) / 2),
+        "EaseOutSine": lambda t: np.sin((t * np.pi) / 2),
+        "EaseInOutSine": lambda t: -(np.cos(np.pi * t) - 1) / 2,
+        "EaseInExpo": lambda t: np.where(t == 0, 0.0, 2.0 ** (10 * (t - 1))),
+        "EaseOutExpo": lambda t: np.where(t == 1, 1.0, 1 - 2.0 ** (-10 * t)),
+        "EaseInOutExpo": lambda t: np.where(
+            t == 0,
+            0.0,
+            np.where(
+                t == 1,
+                1.0,
+                np.where(
+                    t < 0.5,
+                    2.0 ** (20 * t - 10) / 2,
+                    (2 - 2.0 ** (-20 * t + 10)) / 2,
+                ),
+            ),
+        ),
+        "EaseInCirc": lambda t: 1 - np.sqrt(1 - t * t),
+        "EaseOutCirc": lambda t: np.sqrt(np.maximum(0.0, 1 - (t - 1) ** 2)),
+        "EaseInOutCirc": lambda t: np.where(
+            t < 0.5,
+            (1 - np.sqrt(np.maximum(0.0, 1 - (2 * t) ** 2))) / 2,
+            (np.sqrt(np.maximum(0.0, 1 - (-2 * t + 2) ** 2)) + 1) / 2,
+        ),
+        "EaseInBack": ease_in_back,
+        "EaseOutBack": ease_out_back,
+        "EaseInOutBack": ease_in_out_back_array,
+        "EaseInBounce": ease_in_bounce_array,
+        "EaseOutBounce": ease_out_bounce_array,
+        "EaseInOutBounce": ease_in_out_bounce_array,
+    }
+
@@ -14,12 +14,18 @@ is handled by :class:`adofaipy.LevelDict`.
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List
 
 from adofaipy import LevelDict
 
+try:  # orjson is optional; the stdlib parser is used when it is missing.
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
 
 @dataclass
 class Level:
@@ -41,8 +47,21 @@ class Level:
             Path to the ``.adofai`` file.
         """
 
-        ld = LevelDict(str(filename))
-        data = ld._getFileDict()  # type: ignore[attr-defined]
+        # Most ``.adofai`` files are valid strict JSON, so try a C parser on
+        # the raw bytes first.  ``LevelDict`` repairs lenient files (trailing
+        # commas, stray control characters) with per-character regex passes
+        # and parses the file twice, which is orders of magnitude slower.
+        raw = Path(filename).read_bytes()
+        if raw.startswith(b"\xef\xbb\xbf"):
+            raw = raw[3:]
+        try:
+            if orjson is not None:
+                data = orjson.loads(raw)
+            else:
+                data = json.loads(raw)
+        except ValueError:
+            ld = LevelDict(str(filename))
+            data = ld._getFileDict()  # type: ignore[attr-defined]
         if "pathData" not in data and "angleData" in data:
             # ``LevelDict`` exposes ``angleData`` when the file does not contain
             # ``pathData``.  For the purposes of the editor we fall back to that
@@ -86,8 +105,12 @@ class Level:
         dest = filename or self.path
         if dest is None:
             raise ValueError("No filename supplied for Level.write")
-        # ``LevelDict`` exposes a private helper for writing dictionaries.  We
-        # create a temporary instance and delegate the heavy lifting to it.
-        tmp = LevelDict("", encoding="utf-8")
-        tmp._writeDictToFile(self.data, str(dest))  # type: ignore[attr-defined]
+        # Serialise straight from the internal dictionary and write the bytes
+        # in one call; going through ``LevelDict`` would re-serialise with the
+        # pure-Python json.dump one token at a time.
+        if orjson is not None:
+            payload = orjson.dumps(self.data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(self.data, indent=2).encode("utf-8")
+        Path(dest).write_bytes(payload)
 